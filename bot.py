@@ -13,7 +13,7 @@ from typing import List, Dict, Optional, Union
 
 import requests
 from discord import Intents, Interaction, app_commands, Object, TextChannel
-from discord import Message, Role, User, Guild, Member, HTTPException, RateLimited
+from discord import Message, Role, User, Guild, Member, HTTPException, RateLimited, AllowedMentions
 from discord.ext.commands import Bot, CommandInvokeError, Cog, GroupCog
 from dotenv import load_dotenv
 
@@ -21,6 +21,7 @@ load_dotenv()
 TOKEN = os.getenv('DISCORD_TOKEN', 'missing_discord_token')
 DEFAULT_RIGGING_MESSAGE = 'Time to rig some people in! React with 🎉 to participate! Ends: %t'
 DEFAULT_COORDINATION_MESSAGE = 'use this channel share the game data and coordinate. glhf!'
+MESSAGE_LENGTH_LIMIT = 2000
 LOGFORMAT = '%(asctime)s - %(levelname)s - %(funcName)s - %(message)s'
 
 LOGLEVEL = os.getenv('LOGLEVEL', 'WARNING')
@@ -53,6 +54,10 @@ class RiggingProperties:
     winners: List[int] = field(default_factory=list)
     winners_count: int = 0
     end_time: int = 0
+    announcement_chunks: List[List[int]] = field(default_factory=list)
+    published_header: str = None
+    published_winner_counts: List[Optional[int]] = field(default_factory=list)
+    continuation_message_ids: List[int] = field(default_factory=list)
 
 
 @dataclass
@@ -136,6 +141,7 @@ class Rigging(GroupCog, name="rig", description="Manage riggings"):
         self.rigging: Dict[int, Optional[RiggingProperties]] = {}
         self.config: Dict[int, RiggingConfig] = {}
         self.roles_cache: Dict[int, Dict[str, RolesForUser]] = {}
+        self.announcement_locks: Dict[int, asyncio.Lock] = {}
         self.rigging_path = Path(__file__).with_name('rigging.json')
         self.config_path = Path(__file__).with_name('config.json')
         self.roles_cache_path = Path(__file__).with_name('roles-cache.json')
@@ -266,14 +272,112 @@ class Rigging(GroupCog, name="rig", description="Manage riggings"):
                 info(f'Added role {winner_role.name} to {member.name}')
             except CommandInvokeError as ex:
                 warning(f'Could not add role: {ex}')
-        self.rigging[guild.id].winners += [w.id for w in winners]
-        winners_as_string = "\n".join([f'<@{w}>' for w in self.rigging[guild.id].winners])
-        info(f'Editing message to add winners')
-        await message.edit(content=self.get_initial_message(guild) + f'\nWinners:\n{winners_as_string}')
-        info(f'Edited message to add winners')
+        new_winner_ids = [w.id for w in winners]
+        async with self.get_announcement_lock(guild):
+            if not self.rigging[guild.id]:
+                error(f'The rigging for guild {guild.id} has been cancelled while picking winners')
+                return
+            self.rigging[guild.id].winners += new_winner_ids
+            changed_chunks = self.append_winners_to_announcement(guild, new_winner_ids)
+            await self.publish_announcement(guild, message, changed_chunks)
         await self.send_coordination_message(guild)
         self.save_rigging()
 
+    def get_announcement_lock(self, guild: Guild) -> asyncio.Lock:
+        if guild.id not in self.announcement_locks:
+            self.announcement_locks[guild.id] = asyncio.Lock()
+        return self.announcement_locks[guild.id]
+
+    def get_announcement_header(self, guild: Guild, index: int) -> str:
+        if index == 0:
+            return self.get_initial_message(guild) + '\nWinners:'
+        return 'Winners (continued):'
+
+    def render_announcement_chunk(self, guild: Guild, index: int) -> str:
+        winner_ids = self.rigging[guild.id].announcement_chunks[index]
+        return self.get_announcement_header(guild, index) + ''.join(f'\n<@{winner_id}>' for winner_id in winner_ids)
+
+    def append_winners_to_announcement(self, guild: Guild, new_winner_ids: List[int]) -> List[int]:
+        """
+        Append new winners to the announcement chunks.
+        Each chunk holds the winners of one message and its rendered content stays within MESSAGE_LENGTH_LIMIT.
+        Only the first chunk may stay empty, if the rigging message leaves no room for winners.
+
+        :return: The indices of the chunks that have changed
+        """
+        rigging = self.rigging[guild.id]
+        chunks = rigging.announcement_chunks
+        changed_chunks = []
+        if not chunks or (chunks[0] and len(self.render_announcement_chunk(guild, 0)) > MESSAGE_LENGTH_LIMIT):
+            # nothing has been laid out yet (or the rigging message got longer), so lay out all winners again
+            chunks.clear()
+            chunks.append([])
+            rigging.published_winner_counts = []
+            new_winner_ids = rigging.winners
+            changed_chunks.append(0)
+        last_length = len(self.render_announcement_chunk(guild, len(chunks) - 1))
+        for winner_id in new_winner_ids:
+            mention_length = len(f'\n<@{winner_id}>')
+            if last_length + mention_length > MESSAGE_LENGTH_LIMIT:
+                chunks.append([])
+                last_length = len(self.get_announcement_header(guild, len(chunks) - 1))
+            chunks[-1].append(winner_id)
+            last_length += mention_length
+            if len(chunks) - 1 not in changed_chunks:
+                changed_chunks.append(len(chunks) - 1)
+        return changed_chunks
+
+    async def publish_announcement(self, guild: Guild, message: Message, changed_chunks: List[int]):
+        """
+        Edit or send the messages of the changed chunks.
+        The first chunk is always checked, since its header follows the current rigging message config.
+        A chunk counts as published only after Discord accepted it, so a failed call is retried on the next pick.
+        Winners are not pinged, just like when they were only added by editing the rigging message.
+        """
+        rigging = self.rigging[guild.id]
+        published_counts = rigging.published_winner_counts
+        unpublished_chunks = range(len(published_counts), len(rigging.announcement_chunks))
+        for index in sorted({0}.union(changed_chunks, unpublished_chunks)):
+            winners_in_chunk = len(rigging.announcement_chunks[index])
+            header = self.get_announcement_header(guild, index)
+            if (index < len(published_counts) and published_counts[index] == winners_in_chunk
+                    and (index > 0 or rigging.published_header == header)):
+                continue
+            content = self.render_announcement_chunk(guild, index)
+            if len(content) > MESSAGE_LENGTH_LIMIT:
+                warning(f'Not editing message to add winners, the rigging message is too long ({len(content)})')
+                continue
+            if index == 0:
+                info('Editing message to add winners')
+                await message.edit(content=content, allowed_mentions=AllowedMentions.none())
+                info('Edited message to add winners')
+                rigging.published_header = header
+            elif index <= len(rigging.continuation_message_ids):
+                continuation_message_id = rigging.continuation_message_ids[index - 1]
+                info(f'Editing continuation message {continuation_message_id} to add winners')
+                await message.channel.get_partial_message(continuation_message_id).edit(
+                    content=content, allowed_mentions=AllowedMentions.none())
+                info(f'Edited continuation message {continuation_message_id} to add winners')
+            else:
+                info('Sending continuation message with winners')
+                continuation_message = await message.channel.send(content, allowed_mentions=AllowedMentions.none())
+                rigging.continuation_message_ids.append(continuation_message.id)
+                info(f'Sent continuation message {continuation_message.id} with winners')
+            # chunks skipped before this one stay marked as unpublished
+            published_counts.extend([None] * (index + 1 - len(published_counts)))
+            published_counts[index] = winners_in_chunk
+
+    async def delete_continuation_messages(self, guild: Guild, message: Message):
+        for continuation_message_id in self.rigging[guild.id].continuation_message_ids:
+            try:
+                info(f'Deleting continuation message {continuation_message_id}')
+                await message.channel.get_partial_message(continuation_message_id).delete()
+                info(f'Deleted continuation message {continuation_message_id}')
+            except HTTPException as e:
+                error(f'Could not delete continuation message "{continuation_message_id}":')
+                error(e.text)
+        self.rigging[guild.id].continuation_message_ids = []
+
     def _pick_winners_from_users(self, eligible_users, number_of_winners_to_pick, guild):
         winners = []
         for _ in range(number_of_winners_to_pick):
@@ -548,10 +652,13 @@ class Rigging(GroupCog, name="rig", description="Manage riggings"):
             return
         await self.cleanup_previous_riggings(interaction.guild)
         message = await self.get_rigging_message(interaction.guild)
-        info('Editing initial message to say the rigging has been cancelled')
-        await message.edit(content=self.get_initial_message(interaction.guild) + f'\n_this rigging has been cancelled_')
-        info('Edited initial message to say the rigging has been cancelled')
-        self.rigging[interaction.guild.id] = None
+        async with self.get_announcement_lock(interaction.guild):
+            await self.delete_continuation_messages(interaction.guild, message)
+            info('Editing initial message to say the rigging has been cancelled')
+            await message.edit(
+                content=self.get_initial_message(interaction.guild) + f'\n_this rigging has been cancelled_')
+            info('Edited initial message to say the rigging has been cancelled')
+            self.rigging[interaction.guild.id] = None
         info('Sending rigging cancelled confirmation')
         await interaction.followup.send(f'rigging cancelled')
         info('Sent rigging cancelled confirmation')